@@ -1,2 +1,3 @@
-class QuantumCircuit:
-    pass
\ No newline at end of file
+from .quantum_circuit import QuantumCircuit
+
+__all__ = ['QuantumCircuit']
\ No newline at end of file
@@ -1,13 +1,25 @@
 from collections import Counter
-import matplotlib.pyplot as plt
 import numpy as np
 
+from simulator.gates import CNOT, CZ, Identity, Ph, Rx, Ry, Rz
+from simulator.gates.dtype import get_dtype
+from simulator.gates.gate import Gate
+from simulator.kernels import probabilities
+
 class QuantumCircuit:
-    def __init__(self, num_qubits):
+    def __init__(self, num_qubits, dtype=None):
+        """
+        Initialize a quantum circuit in the |0...0> state.
+
+        :param num_qubits: Number of qubits in the circuit.
+        :param dtype: Complex dtype of the state vector. Defaults to simulator.gates.dtype.get_dtype().
+        """
         self.num_qubits = num_qubits
+        self.dtype = np.dtype(dtype) if dtype is not None else get_dtype()
         self.gates = []
-        self.state = np.zeros(2**num_qubits, dtype=complex)
+        self.state = np.zeros(2**num_qubits, dtype=self.dtype)
         self.state[0] = 1  # Initialize to |0...0> state
+        self._compiled_gates = ((), [])  # (gates the cache was built from, compiled gates)
 
     def add_gate(self, gate):
         """
@@ -23,42 +35,120 @@ class QuantumCircuit:
 
     def apply(self):
         """Apply all gates in the circuit to the quantum state."""
-        for gate in self.gates:
+        # Reuse the fused gate list as long as the circuit holds the same gates
+        gates = tuple(self.gates)
+        if self._compiled_gates[0] != gates:
+            self._compiled_gates = (gates, self.compile())
+
+        for gate in self._compiled_gates[1]:
             self.state = gate.apply(self.state)
 
-    def _apply_single_qubit_gate(self, gate_matrix, target_qubit):
-        """Apply a single-qubit gate to the state."""
-        identity = np.eye(2, dtype=complex)
-        operator = 1
-        for i in range(self.num_qubits):
-            if i == target_qubit:
-                operator = np.kron(operator, gate_matrix)
-            else:
-                operator = np.kron(operator, identity)
-        self.state = operator @ self.state
+    def compile(self):
+        """
+        Fuse consecutive single-qubit gates acting on the same qubit.
+
+        Gates on one qubit are collected until a multi-qubit gate touches that qubit,
+        then multiplied into a single 2x2 gate, so each run sweeps the state vector once.
+        Identity gates, zero-angle rotations, runs that multiply out to the identity (e.g. H H)
+        and back-to-back identical CNOT/CZ pairs are dropped.
+
+        :return: List of gates equivalent to self.gates.
+        """
+        compiled = []
+        pending = {}  # qubit -> gates waiting to be fused, in application order
+
+        def flush(qubit):
+            fused = _fuse(pending.pop(qubit))
+            if fused is not None:
+                compiled.append(fused)
+
+        for gate in self.gates:
+            if _is_noop(gate):
+                continue
+
+            if len(gate.qubits) == 1 and gate.matrix is not None and gate.matrix.shape == (2, 2):
+                pending.setdefault(gate.qubits[0], []).append(gate)
+                continue
+
+            # Flush the qubits this gate touches (all of them for full-register gates)
+            touched = gate.qubits if gate.qubits else list(pending)
+            for qubit in touched:
+                if qubit in pending:
+                    flush(qubit)
 
-    def _apply_multi_qubit_gate(self, gate_matrix):
-        """Apply a multi-qubit gate to the state."""
-        self.state = gate_matrix @ self.state
+            # Nothing acted on these qubits since an identical self-inverse gate, so the pair cancels
+            if compiled and isinstance(gate, (CNOT, CZ)) and type(compiled[-1]) is type(gate) \
+                    and compiled[-1].qubits == gate.qubits:
+                compiled.pop()
+                continue
+            compiled.append(gate)
+
+        for qubit in list(pending):
+            flush(qubit)
+        return compiled
 
     def reset(self):
         """Reset the circuit by clearing all gates and resetting the state."""
         self.gates = []
-        self.state = np.zeros(2**self.num_qubits, dtype=complex)
+        # Reuse the existing buffer instead of allocating a new 2^n vector
+        self.state.fill(0)
         self.state[0] = 1
 
+    def reset_to(self, state):
+        """
+        Overwrite the state vector with a copy of a previously prepared state, keeping the gates.
+
+        Restoring a cached state is a single copy, whereas reset() followed by re-adding and
+        re-applying the gates sweeps the state vector once per gate.
+
+        :param state: State vector to restore, e.g. a copy of self.state taken after apply().
+        """
+        np.copyto(self.state, state)
+
     def measure_state(self):
         """
         Measure the quantum state and return the collapsed state and measurement result.
 
+        The state vector is collapsed in place, so the returned measured_state is the
+        circuit's own state vector rather than a copy.
+
         :return: Tuple (measured_state, measured_basis_state).
         """
-        probabilities = np.abs(self.state) ** 2
-        measured_basis_state = np.random.choice(len(probabilities), p=probabilities)
-        collapsed_state = np.zeros_like(self.state, dtype=complex)
-        collapsed_state[measured_basis_state] = 1
-        self.state = collapsed_state
-        return collapsed_state, measured_basis_state
+        # np.random.choice checks the sum to ~1e-8, tighter than complex64 rounding over a deep circuit
+        state_probabilities = probabilities(self.state).astype(np.float64)
+        state_probabilities /= state_probabilities.sum()
+        measured_basis_state = np.random.choice(len(state_probabilities), p=state_probabilities)
+        self.state.fill(0)
+        self.state[measured_basis_state] = 1
+        return self.state, measured_basis_state
+
+    def measure_samples(self, num_shots, rng=None):
+        """
+        Draw measurement outcomes from the current state without collapsing it.
+
+        All shots are drawn in one pass with a binary search over the cumulative
+        distribution of the basis state probabilities.
+
+        :param num_shots: Number of measurements to draw.
+        :param rng: Optional numpy random Generator. A new default generator is used if omitted.
+        :return: Array with the measured basis state of every shot.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+
+        cumulative = np.cumsum(probabilities(self.state))
+        draws = rng.random(num_shots) * cumulative[-1]
+        return np.searchsorted(cumulative, draws, side='right')
+
+    def sample(self, num_shots, rng=None):
+        """
+        Sample measurement outcomes from the current state without collapsing it.
+
+        :param num_shots: Number of measurements to draw.
+        :param rng: Optional numpy random Generator. A new default generator is used if omitted.
+        :return: Array with the number of times each basis state was measured.
+        """
+        return np.bincount(self.measure_samples(num_shots, rng), minlength=len(self.state))
 
     def simulate(self, num_measurements=1000):
         """
@@ -70,20 +160,16 @@ class QuantumCircuit:
         # Apply all gates in the circuit to get the final state
         self.apply()
 
-        # Calculate probabilities of each basis state
-        probabilities = np.abs(self.state) ** 2
-
-        # Perform measurements based on probabilities
-        measurement_results = np.random.choice(
-            len(probabilities), size=num_measurements, p=probabilities
-        )
-
-        # Count occurrences of each measured state
-        counts = Counter(measurement_results)
+        # Draw all measurements at once and keep only the observed basis states
+        state_counts = self.sample(num_measurements)
+        observed = np.flatnonzero(state_counts)
+        observed_counts = state_counts[observed]
+        states = observed.tolist()
+        counts = Counter(dict(zip(states, observed_counts.tolist())))
 
         # Display the results
         print("Measurement results (counts):", counts)
-        print("Empirical probabilities:", {state: count / num_measurements for state, count in counts.items()})
+        print("Empirical probabilities:", dict(zip(states, (observed_counts / num_measurements).tolist())))
 
         return counts
 
@@ -91,18 +177,21 @@ class QuantumCircuit:
         """
         Run the quantum circuit and visualize the state probabilities.
         """
+        import matplotlib.pyplot as plt
+
         # Step 1: Apply all gates
         self.apply()
 
         # Step 2: Calculate probabilities of each basis state
-        probabilities = np.abs(self.state) ** 2
+        state_probabilities = probabilities(self.state)
 
         # Step 3: Generate the labels for the states
-        num_states = len(probabilities)
-        state_labels = [format(i, f'0{self.num_qubits}b') for i in range(num_states)]
+        num_states = len(state_probabilities)
+        spec = f'0{self.num_qubits}b'
+        state_labels = [format(i, spec) for i in range(num_states)]
 
         # Step 4: Plot the probabilities
-        plt.bar(state_labels, probabilities)
+        plt.bar(state_labels, state_probabilities)
         plt.xlabel("Basis States")
         plt.ylabel("Probability")
         plt.title("Quantum State Probabilities")
@@ -114,6 +203,8 @@ class QuantumCircuit:
         """
         Visualize the quantum circuit, showing qubits and gates.
         """
+        import matplotlib.pyplot as plt
+
         fig_width = max(6, len(self.gates) * 1.5)
         fig_height = max(2, self.num_qubits * 1.5)
         fig, ax = plt.subplots(figsize=(fig_width, fig_height))
@@ -155,3 +246,35 @@ class QuantumCircuit:
         plt.tight_layout()
         plt.show()
 
+
+def _is_noop(gate):
+    """Return True for gates that leave every state unchanged (Identity, zero-angle rotations)."""
+    if isinstance(gate, Identity):
+        return True
+    if isinstance(gate, (Rx, Ry, Rz)):
+        return abs(gate.theta) < 1e-12
+    if isinstance(gate, Ph):
+        return abs(gate.delta) < 1e-12
+    return False
+
+
+def _fuse(gates):
+    """
+    Multiply a run of single-qubit gates on the same qubit into one gate.
+
+    :param gates: Gates in application order, all acting on the same qubit.
+    :return: The gate itself for a run of one, None if the run multiplies out to the identity,
+             otherwise a Gate with the product matrix.
+    """
+    if len(gates) == 1:
+        return gates[0]
+
+    fused = Gate(name="*".join(gate.name for gate in reversed(gates)), qubits=list(gates[0].qubits))
+    fused.matrix = gates[0].matrix
+    for gate in gates[1:]:
+        fused.matrix = gate.matrix @ fused.matrix
+
+    # Same 1e-12 scale as _is_noop, so only rounding error is dropped and small rotations survive
+    if np.max(np.abs(fused.matrix - np.eye(2))) < 1e-12:
+        return None
+    return fused
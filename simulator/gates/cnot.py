@@ -1,5 +1,6 @@
 import numpy as np
-from .gate import Gate
+from .gate import Gate, _num_qubits
+from ..kernels import apply_cnot
 
 class CNOT(Gate):
     def __init__(self, control_qubit, target_qubit):
@@ -19,27 +20,27 @@ class CNOT(Gate):
             [0, 0, 1, 0]
         ], dtype=complex)
 
-    def apply(self, state_vector):
+    def apply(self, state_vector, out=None):
         """
         Apply the CNOT gate to the given quantum state vector.
 
         :param state_vector: The state vector of the quantum system.
-        :return: The modified state vector after applying the CNOT gate.
+        :param out: Optional preallocated array, shaped and typed like state_vector, to write the result into.
+        :return: The modified state vector after applying the CNOT gate (out, if given).
         """
         if len(self.qubits) != 2:
             raise ValueError("CNOT gate requires exactly two qubits: control and target.")
 
         control_qubit, target_qubit = self.qubits
-        num_qubits = int(np.log2(len(state_vector)))
+        num_qubits = _num_qubits(state_vector)
 
         if control_qubit >= num_qubits or target_qubit >= num_qubits:
             raise ValueError("Control or target qubit index exceeds the number of qubits in the state vector.")
 
-        # Generate the full operator for the system
-        operator = self.get_operator(num_qubits)
+        if control_qubit == target_qubit:
+            raise ValueError("Control and target qubits cannot be the same.")
 
-        # Apply the operator to the state vector
-        return operator @ state_vector
+        return apply_cnot(state_vector, control_qubit, target_qubit, num_qubits, out)
 
     def get_operator(self, num_qubits):
         """
@@ -51,18 +52,12 @@ class CNOT(Gate):
         if self.matrix is None:
             raise ValueError("Gate matrix is not defined.")
 
-        # Start with identity
-        identity = np.eye(2, dtype=complex)
+        control_qubit, target_qubit = self.qubits
 
-        # Build the full operator using Kronecker products
-        operator = 1
-        for i in range(num_qubits):
-            if i == self.qubits[0]:  # Control qubit
-                continue
-            elif i == self.qubits[1]:  # Target qubit
-                operator = np.kron(operator, self.matrix)
-            else:
-                operator = np.kron(operator, identity)
+        # CNOT permutes basis states: row i of the operator picks amplitude permutation[i]
+        permutation = apply_cnot(np.arange(2 ** num_qubits), control_qubit, target_qubit, num_qubits)
+        operator = np.zeros((2 ** num_qubits, 2 ** num_qubits), dtype=self.matrix.dtype)
+        operator[np.arange(2 ** num_qubits), permutation] = 1
 
         return operator
 
@@ -1,5 +1,6 @@
 import numpy as np
-from .gate import Gate
+from .gate import Gate, _num_qubits
+from ..kernels import apply_cz
 
 class CZ(Gate):
     def __init__(self, qubits=None):
@@ -20,18 +21,19 @@ class CZ(Gate):
             [0, 0, 0, -1]
         ], dtype=complex)
 
-    def apply(self, state_vector):
+    def apply(self, state_vector, out=None):
         """
         Apply the CZ gate to the given quantum state vector.
 
         :param state_vector: The state vector of the quantum system.
-        :return: The modified state vector after applying the CZ gate.
+        :param out: Optional preallocated array, shaped and typed like state_vector, to write the result into.
+        :return: The modified state vector after applying the CZ gate (out, if given).
         """
         if len(self.qubits) != 2:
             raise ValueError("CZ gate requires exactly two qubits.")
 
         control, target = self.qubits
-        num_qubits = int(np.log2(len(state_vector)))
+        num_qubits = _num_qubits(state_vector)
 
         # Validate qubit indices
         if control >= num_qubits or target >= num_qubits:
@@ -40,9 +42,7 @@ class CZ(Gate):
         if control == target:
             raise ValueError("Control and target qubits cannot be the same.")
 
-        # Build the full operator for the CZ gate
-        operator = self.get_operator(num_qubits)
-        return operator @ state_vector
+        return apply_cz(state_vector, control, target, num_qubits, out)
 
     def get_operator(self, num_qubits):
         """
@@ -62,20 +62,6 @@ class CZ(Gate):
         if control == target:
             raise ValueError("Control and target qubits cannot be the same.")
 
-        # Total dimension of the state space
-        dim = 2 ** num_qubits
-
-        # Initialize the full CZ operator as an identity matrix
-        full_operator = np.eye(dim, dtype=complex)
-
-        # Apply the -1 phase to the |11> state
-        for i in range(dim):
-            # Convert index to binary representation
-            binary_state = format(i, f'0{num_qubits}b')
-
-            # Check if both control and target qubits are in the |1> state
-            if binary_state[control] == '1' and binary_state[target] == '1':
-                full_operator[i, i] = -1  # Apply phase flip
-
-        return full_operator
-
+        # CZ is diagonal: the identity with -1 wherever control and target are both |1>
+        diagonal = np.ones(2 ** num_qubits, dtype=self.matrix.dtype)
+        return np.diag(apply_cz(diagonal, control, target, num_qubits))
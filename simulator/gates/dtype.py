@@ -0,0 +1,29 @@
+import os
+
+import numpy as np
+
+# Single precision halves the memory traffic of every sweep over the state vector;
+# QESTKIT_PRECISION=double (or complex128) selects double precision at import time.
+# Gate matrices are always built in complex128 and cast to the state dtype when applied.
+STATE_DTYPE = np.complex128 if os.environ.get("QESTKIT_PRECISION", "").lower() in ("double", "complex128") else np.complex64
+
+
+def get_dtype():
+    """
+    Return the default complex dtype of new state vectors.
+
+    :return: The numpy dtype, complex64 unless double precision was enabled.
+    """
+    return np.dtype(STATE_DTYPE)
+
+
+def enable_double_precision(enabled=True):
+    """
+    Switch new state vectors to complex128 (or back to complex64).
+
+    Only affects circuits and registers created after the call.
+
+    :param enabled: True for complex128, False to return to complex64.
+    """
+    global STATE_DTYPE
+    STATE_DTYPE = np.complex128 if enabled else np.complex64
@@ -1,5 +1,13 @@
 import numpy as np
 
+from ..kernels import apply_single_qubit
+
+
+def _num_qubits(state_vector):
+    """Return the number of qubits of a 2^n state vector, using integer arithmetic only."""
+    return len(state_vector).bit_length() - 1
+
+
 class Gate:
     def __init__(self, name, qubits=None):
         """
@@ -12,35 +20,26 @@ class Gate:
         self.qubits = qubits if qubits is not None else []
         self.matrix = None  # Should be defined in subclasses
 
-    def apply(self, state_vector):
+    def apply(self, state_vector, out=None):
         """
-        Apply the Hadamard gate to the given quantum state vector.
+        Apply the single-qubit gate to the given quantum state vector.
 
         :param state_vector: The state vector of the quantum system.
-        :return: The modified state vector after applying the Hadamard gate.
+        :param out: Optional preallocated array, shaped and typed like state_vector and not
+                    overlapping it, to write the result into instead of allocating a new one.
+        :return: The modified state vector after applying the gate (out, if given).
         """
         if self.qubits is None or len(self.qubits) != 1:
-            raise ValueError("Hadamard gate requires exactly one target qubit.")
+            raise ValueError(f"{self.name} gate requires exactly one target qubit.")
 
         target_qubit = self.qubits[0]
-        num_qubits = int(np.log2(len(state_vector)))
+        num_qubits = _num_qubits(state_vector)
 
         if target_qubit >= num_qubits:
             raise ValueError("Target qubit index exceeds the number of qubits in the state vector.")
 
-        # Construct the full operator by combining identity and Hadamard gate
-        identity = np.eye(2, dtype=complex)
-        if target_qubit == 0:
-            operator = self.matrix
-        else:
-            operator = identity
-        for i in range(1, num_qubits):
-            if i == target_qubit:
-                operator = np.kron(operator, self.matrix)
-            else:
-                operator = np.kron(operator, identity)
-
-        return operator @ state_vector
+        # Act on the target axis only instead of building the 2^n x 2^n kron operator
+        return apply_single_qubit(state_vector, self.matrix, target_qubit, out)
 
     def validate(self, num_qubits):
         """
@@ -62,15 +61,13 @@ class Gate:
         if self.matrix is None:
             raise ValueError("Gate matrix is not defined.")
 
-        identity = np.eye(2, dtype=complex)
-        operator = self.matrix
-
-        for i in range(num_qubits):
-            if i == self.qubits[0]:
-                continue
-            operator = np.kron(identity, operator)
+        # I(2^before) (x) M (x) I(2^after), written into one (2^n, 2^n) array in a single einsum
+        target_qubit = self.qubits[0]
+        before = np.eye(2 ** target_qubit, dtype=self.matrix.dtype)
+        after = np.eye(2 ** (num_qubits - target_qubit - 1), dtype=self.matrix.dtype)
+        operator = np.einsum('ab,ij,xy->aixbjy', before, self.matrix, after)
 
-        return operator
+        return operator.reshape(2 ** num_qubits, 2 ** num_qubits)
 
     def __repr__(self):
         return f"Gate(name={self.name}, qubits={self.qubits})"
\ No newline at end of file
@@ -1,6 +1,10 @@
+import math
+
 import numpy as np
 from .gate import Gate
 
+_INV_SQRT2 = math.sqrt(0.5)
+
 class Hadamard(Gate):
     def __init__(self, qubits=None):
         """
@@ -10,7 +14,7 @@ class Hadamard(Gate):
         """
         super().__init__(name='H', qubits=qubits)
         self.matrix = np.array([
-            [1 / np.sqrt(2), 1 / np.sqrt(2)],
-            [1 / np.sqrt(2), -1 / np.sqrt(2)]
+            [_INV_SQRT2, _INV_SQRT2],
+            [_INV_SQRT2, -_INV_SQRT2]
         ], dtype=complex)
         self.name = "Hadamard"
\ No newline at end of file
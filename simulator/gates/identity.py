@@ -14,12 +14,25 @@ class Identity(Gate):
             [0, 1]
         ], dtype=complex)
 
-    def apply(self, state_vector):
+    def apply(self, state_vector, out=None):
         """
         Apply the Identity gate to the given quantum state vector.
 
         :param state_vector: The state vector of the quantum system.
-        :return: The unmodified state vector.
+        :param out: Optional preallocated array to copy the state vector into.
+        :return: The unmodified state vector (a copy in out, if given).
         """
         # The Identity gate does not modify the state vector
-        return state_vector
+        if out is None:
+            return state_vector
+        np.copyto(out, state_vector)
+        return out
+
+    def get_operator(self, num_qubits):
+        """
+        Construct the full operator for the quantum system.
+
+        :param num_qubits: Total number of qubits in the quantum system.
+        :return: The 2^n x 2^n identity matrix.
+        """
+        return np.eye(2 ** num_qubits, dtype=self.matrix.dtype)
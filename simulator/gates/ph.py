@@ -1,3 +1,5 @@
+import cmath
+
 import numpy as np
 from .gate import Gate
 
@@ -11,7 +13,6 @@ class Ph(Gate):
         """
         super().__init__(name='Ph', qubits=qubits)
         self.delta = delta
-        self.matrix = np.array([
-            [1, 0],
-            [0, np.exp(1j * delta)]
-        ], dtype=complex)
+        self.matrix = np.zeros((2, 2), dtype=complex)
+        self.matrix[0, 0] = 1
+        self.matrix[1, 1] = cmath.exp(1j * delta)
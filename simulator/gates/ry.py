@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 from .gate import Gate
 
@@ -11,7 +13,8 @@ class Ry(Gate):
         """
         super().__init__(name='Ry', qubits=qubits)
         self.theta = theta
-        self.matrix = np.array([
-            [np.cos(theta / 2), -np.sin(theta / 2)],
-            [np.sin(theta / 2), np.cos(theta / 2)]
-        ], dtype=complex)
+        cos, sin = math.cos(theta / 2), math.sin(theta / 2)
+        self.matrix = np.empty((2, 2), dtype=complex)
+        self.matrix[0, 0] = self.matrix[1, 1] = cos
+        self.matrix[0, 1] = -sin
+        self.matrix[1, 0] = sin
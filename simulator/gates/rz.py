@@ -1,3 +1,5 @@
+import cmath
+
 import numpy as np
 from .gate import Gate
 
@@ -11,8 +13,8 @@ class Rz(Gate):
         """
         super().__init__(name='Rz', qubits=qubits)
         self.theta = theta
-        self.matrix = np.array([
-            [np.exp(-1j * theta / 2), 0],
-            [0, np.exp(1j * theta / 2)]
-        ], dtype=complex)
+        phase = cmath.exp(1j * theta / 2)
+        self.matrix = np.zeros((2, 2), dtype=complex)
+        self.matrix[0, 0] = phase.conjugate()
+        self.matrix[1, 1] = phase
 
@@ -0,0 +1,185 @@
+import numpy as np
+
+# Below this many contiguous amplitudes per target half, apply_single_qubit switches to row blocks
+_SHORT_RUN = 8
+
+
+def probabilities(state_vector, out=None):
+    """
+    Compute the measurement probability of every basis state.
+
+    Uses re^2 + im^2 directly, avoiding the square root (and the extra temporary)
+    of np.abs(state_vector) ** 2.
+
+    :param state_vector: The state vector of the quantum system.
+    :param out: Optional real array to write the probabilities into.
+    :return: Array of probabilities, one per basis state.
+    """
+    real, imag = state_vector.real, state_vector.imag
+    out = np.multiply(real, real, out=out)
+    out += imag * imag
+    return out
+
+
+def apply_single_qubit(state_vector, matrix, target_qubit, out=None):
+    """
+    Apply a 2x2 matrix to one qubit of a state vector.
+
+    The state is viewed as (qubits before target, target, qubits after target),
+    so the matrix only acts on the target axis instead of a 2^n x 2^n operator.
+    Gate matrices are built in complex128 and cast to the state dtype here on every call,
+    so one gate object can be shared between circuits of different precision.
+
+    :param state_vector: The state vector of the quantum system.
+    :param matrix: 2x2 matrix of the gate.
+    :param target_qubit: Index of the target qubit (qubit 0 is the most significant).
+    :param out: Optional contiguous array, shaped like state_vector and of the result dtype (the state
+                dtype for complex states), to write the result into. It must not overlap state_vector.
+    :return: The new state vector (out, if given).
+    """
+    if np.iscomplexobj(state_vector):
+        # Match the state precision so a complex128 matrix does not promote a complex64 state
+        matrix = matrix.astype(state_vector.dtype, copy=False)
+    else:
+        # Real or integer states are promoted, never the complex matrix truncated to them
+        dtype = np.result_type(state_vector, matrix)
+        state_vector = state_vector.astype(dtype)
+        matrix = matrix.astype(dtype, copy=False)
+    if state_vector.size == 2:
+        # A single-qubit state is just a 2x2 matvec; skip the dispatch and reshapes below
+        return np.matmul(matrix, state_vector, out=out)
+    if matrix[0, 1] == 0 and matrix[1, 0] == 0:
+        return apply_diagonal(state_vector, matrix[0, 0], matrix[1, 1], target_qubit, out)
+    if matrix[0, 0] == 0 and matrix[1, 1] == 0:
+        return apply_antidiagonal(state_vector, matrix[0, 1], matrix[1, 0], target_qubit, out)
+
+    view = state_vector.reshape(2 ** target_qubit, 2, -1)
+
+    run = view.shape[2]
+    if run <= _SHORT_RUN:
+        # For the least significant qubits the batched 2x2 matmul degenerates into millions of
+        # tiny products; multiply whole rows of 2*run amplitudes by kron(matrix, I) instead
+        block = np.kron(matrix, np.eye(run, dtype=matrix.dtype))
+        rows = state_vector.reshape(-1, 2 * run)
+        if out is None:
+            return (rows @ block.T).reshape(-1)
+        np.matmul(rows, block.T, out=out.reshape(rows.shape))
+        return out
+
+    if out is None:
+        return (matrix @ view).reshape(-1)
+    np.matmul(matrix, view, out=out.reshape(view.shape))
+    return out
+
+
+def apply_diagonal(state_vector, phase_zero, phase_one, target_qubit, out=None):
+    """
+    Apply a diagonal 2x2 gate (S, T, Z, Rz, Ph, ...) to one qubit of a state vector.
+
+    Each half of the state is scaled by its phase, and halves whose phase is 1 are skipped,
+    so S, T and Ph only touch the amplitudes where the target qubit is |1>.
+
+    :param state_vector: The state vector of the quantum system.
+    :param phase_zero: Diagonal entry applied where the target qubit is |0>.
+    :param phase_one: Diagonal entry applied where the target qubit is |1>.
+    :param target_qubit: Index of the target qubit (qubit 0 is the most significant).
+    :param out: Optional contiguous array, shaped and typed like state_vector, to write the result into.
+    :return: The new state vector (out, if given).
+    """
+    if out is None:
+        new_state = np.array(state_vector)
+    else:
+        new_state = out
+        np.copyto(new_state, state_vector)
+    view = new_state.reshape(2 ** target_qubit, 2, -1)
+
+    if phase_zero != 1:
+        view[:, 0] *= phase_zero
+    if phase_one != 1:
+        view[:, 1] *= phase_one
+    return new_state
+
+
+def apply_antidiagonal(state_vector, phase_zero, phase_one, target_qubit, out=None):
+    """
+    Apply an anti-diagonal 2x2 gate (X, Y) to one qubit of a state vector.
+
+    The halves of the state where the target is |0> and |1> are swapped and scaled by their
+    phase in the same pass, so X is a pure permuted copy and Y a single multiply per amplitude.
+
+    :param state_vector: The state vector of the quantum system.
+    :param phase_zero: Matrix entry [0, 1], applied to the amplitudes moved into target |0>.
+    :param phase_one: Matrix entry [1, 0], applied to the amplitudes moved into target |1>.
+    :param target_qubit: Index of the target qubit (qubit 0 is the most significant).
+    :param out: Optional contiguous array, shaped and typed like state_vector, to write the result into.
+                It must not overlap state_vector.
+    :return: The new state vector (out, if given).
+    """
+    new_state = np.empty_like(state_vector) if out is None else out
+    view = new_state.reshape(2 ** target_qubit, 2, -1)
+    source = state_vector.reshape(2 ** target_qubit, 2, -1)
+
+    # Write each swapped half in one pass, scaling on the way when its phase is not 1
+    for half, phase in ((0, phase_zero), (1, phase_one)):
+        if phase != 1:
+            np.multiply(source[:, 1 - half], phase, out=view[:, half])
+        else:
+            view[:, half] = source[:, 1 - half]
+    return new_state
+
+
+def apply_cnot(state_vector, control_qubit, target_qubit, num_qubits, out=None):
+    """
+    Apply a CNOT to a state vector by swapping amplitudes.
+
+    Where the control qubit is |1>, the target |0> and |1> amplitudes are swapped.
+
+    :param state_vector: The state vector of the quantum system.
+    :param control_qubit: Index of the control qubit.
+    :param target_qubit: Index of the target qubit.
+    :param num_qubits: Total number of qubits in the state vector.
+    :param out: Optional contiguous array, shaped and typed like state_vector, to write the result into.
+    :return: The new state vector (out, if given).
+    """
+    if out is None:
+        new_state = np.array(state_vector)
+    else:
+        new_state = out
+        np.copyto(new_state, state_vector)
+    view = new_state.reshape([2] * num_qubits)
+
+    target_zero = [slice(None)] * num_qubits
+    target_zero[control_qubit] = 1
+    target_one = list(target_zero)
+    target_zero[target_qubit] = 0
+    target_one[target_qubit] = 1
+    target_zero, target_one = tuple(target_zero), tuple(target_one)
+
+    view[target_zero], view[target_one] = view[target_one], view[target_zero].copy()
+    return new_state
+
+
+def apply_cz(state_vector, control_qubit, target_qubit, num_qubits, out=None):
+    """
+    Apply a CZ to a state vector by flipping the sign of the |11> amplitudes.
+
+    :param state_vector: The state vector of the quantum system.
+    :param control_qubit: Index of the control qubit.
+    :param target_qubit: Index of the target qubit.
+    :param num_qubits: Total number of qubits in the state vector.
+    :param out: Optional contiguous array, shaped and typed like state_vector, to write the result into.
+    :return: The new state vector (out, if given).
+    """
+    if out is None:
+        new_state = np.array(state_vector)
+    else:
+        new_state = out
+        np.copyto(new_state, state_vector)
+    view = new_state.reshape([2] * num_qubits)
+
+    both_one = [slice(None)] * num_qubits
+    both_one[control_qubit] = 1
+    both_one[target_qubit] = 1
+
+    view[tuple(both_one)] *= -1
+    return new_state
@@ -1,28 +1,25 @@
 import numpy as np
 
+from simulator.gates.dtype import get_dtype
+from simulator.kernels import apply_single_qubit, probabilities
+
 class QuantumRegister:
     def __init__(self, num_qubits):
         self.num_qubits = num_qubits
-        self.state_vector = np.zeros(2**num_qubits, dtype=complex)  # Create state vector
+        self.state_vector = np.zeros(2**num_qubits, dtype=get_dtype())  # Create state vector
         self.state_vector[0] = 1  # Initialize to |0...0> state
 
     def apply_gate(self, gate_matrix, target_qubit):
-        # Expand the gate to act on the entire register by creating an identity
-        full_gate = np.eye(1)
-        for i in range(self.num_qubits):
-            if i == target_qubit:
-                full_gate = np.kron(full_gate, gate_matrix)  # Apply gate to target qubit
-            else:
-                full_gate = np.kron(full_gate, np.eye(2))    # Apply identity to other qubits
-        self.state_vector = np.dot(full_gate, self.state_vector)  # Update state vector
+        # Act on the target axis only instead of expanding the gate to a 2^n x 2^n operator
+        self.state_vector = apply_single_qubit(self.state_vector, np.asarray(gate_matrix), target_qubit)
 
     def measure(self):
         # Probabilities of measuring each state
-        probabilities = np.abs(self.state_vector) ** 2
+        state_probabilities = probabilities(self.state_vector)
         # Choose a state based on these probabilities
-        measured_state = np.random.choice(2**self.num_qubits, p=probabilities)
+        measured_state = np.random.choice(2**self.num_qubits, p=state_probabilities)
         # Reset the state vector to the measured state
-        new_state_vector = np.zeros(2**self.num_qubits, dtype=complex)
+        new_state_vector = np.zeros(2**self.num_qubits, dtype=self.state_vector.dtype)
         new_state_vector[measured_state] = 1
         self.state_vector = new_state_vector
         # Return the measured state in binary representation
@@ -0,0 +1,16 @@
+import numpy as np
+
+
+def close(actual, expected, tol=1e-6):
+    """
+    Check that two state arrays agree to within an absolute tolerance.
+
+    A single max(|a - b|) reduction, without the relative term and broadcasting of np.allclose.
+    The default tolerance leaves room for the rounding of complex64 states.
+
+    :param actual: Computed states.
+    :param expected: Expected states.
+    :param tol: Largest allowed absolute difference of any amplitude.
+    :return: True if every amplitude is within tol of the expected one.
+    """
+    return float(np.abs(np.asarray(actual) - np.asarray(expected)).max()) < tol
@@ -0,0 +1,32 @@
+import numpy as np
+
+from simulator.kernels import apply_single_qubit, probabilities
+
+
+def apply_gate(states, gate, rows):
+    """
+    Apply a single-qubit gate to the selected one-qubit states with the simulator kernel.
+
+    All qubits are held in one (num_bits, 2) array, one state per row. The selected rows are
+    laid out as one block of |0> amplitudes followed by one block of |1> amplitudes, which is
+    how the kernel sees target qubit 0, so the whole selection is a single kernel call.
+
+    :param states: Array of shape (num_bits, 2) with the one-qubit states, updated in place.
+    :param gate: Single-qubit gate to apply.
+    :param rows: Boolean mask of the rows to apply the gate to.
+    """
+    if not rows.any():
+        return
+    halves = np.ascontiguousarray(states[rows].T).reshape(-1)
+    states[rows] = apply_single_qubit(halves, gate.matrix, 0).reshape(2, -1).T
+
+
+def measure(states, rng):
+    """
+    Measure every one-qubit state in the computational basis.
+
+    :param states: Array of shape (num_bits, 2) with the one-qubit states.
+    :param rng: numpy random Generator to draw the outcomes from.
+    :return: Array of measured bits.
+    """
+    return (rng.random(len(states)) < probabilities(states[:, 1])).astype(np.uint8)
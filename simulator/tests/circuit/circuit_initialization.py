@@ -1,15 +1,22 @@
 import numpy as np
 from simulator.gates import Hadamard
+from simulator.gates.dtype import get_dtype
 
-def initialize_superposition(num_qubits):
+def initialize_superposition(num_qubits, verify=False):
     """
     Initialize a quantum system of `num_qubits` in superposition.
 
     :param num_qubits: Number of qubits in the system.
+    :param verify: Build the state by applying a Hadamard gate to every qubit of |0...0>
+                   instead of filling in the known amplitudes directly.
     :return: State vector of the system in superposition.
     """
+    if not verify:
+        # H on every qubit gives the same amplitude 2^(-n/2) on every basis state
+        return np.full(2**num_qubits, 0.5 ** (num_qubits / 2), dtype=get_dtype())
+
     # Start with the |0...0> state (all qubits in |0>)
-    state_vector = np.zeros(2**num_qubits, dtype=complex)
+    state_vector = np.zeros(2**num_qubits, dtype=get_dtype())
     state_vector[0] = 1  # Set the |0...0> state to amplitude 1
 
     # Apply the Hadamard gate to each qubit
@@ -27,8 +34,8 @@ def test_initialize_superposition():
     num_qubits = 2  # Example: 3 qubits
     expected_amplitude = 1 / np.sqrt(2**num_qubits)
 
-    # Initialize the state vector
-    state_vector = initialize_superposition(num_qubits)
+    # Initialize the state vector through the Hadamard gates
+    state_vector = initialize_superposition(num_qubits, verify=True)
 
     # Verify the amplitudes of all states are equal
     expected_state_vector = np.array(
@@ -40,6 +47,9 @@ def test_initialize_superposition():
         f"Initialization failed. Expected {expected_state_vector}, got {state_vector}"
     )
 
+    # The closed-form fill must agree with the gate-based construction
+    assert np.allclose(initialize_superposition(num_qubits), state_vector)
+
     print(f"Test passed for {num_qubits} qubits. State is \n{state_vector}")
 
 if __name__ == "__main__":
@@ -1,30 +1,32 @@
-import random
-from collections import Counter
-
 import numpy as np
 from simulator.gates import Hadamard, X, CZ
+from simulator.gates.gate import Gate
 from simulator.circuit.quantum_circuit import QuantumCircuit
+from simulator import kernels
+
 
-def run_simulation(circuit, num_simulations=100):
+def run_simulation(circuit, num_simulations=100, verbose=False, rng=None):
     """
     Simulate a quantum circuit multiple times, returning counts of measurement outcomes
-    and printing raw probabilities after applying the circuit.
+    and optionally printing raw probabilities after applying the circuit.
 
     :param circuit: The QuantumCircuit object.
     :param num_simulations: Number of times to simulate the circuit.
+    :param verbose: Print the probability of every basis state with a non-negligible probability.
+    :param rng: Optional numpy random Generator. A new default generator is used if omitted.
     :return: A dictionary with counts of each measured outcome.
     """
     # Apply all gates in the circuit to compute the final state
     circuit.apply()
 
-    # Calculate probabilities of each basis state
-    probabilities = np.abs(circuit.state) ** 2
+    # Calculate the probabilities once; the table, the normalization check and sampling share them
+    probabilities = kernels.probabilities(circuit.state)
 
-    # Print raw probabilities for all basis states
-    print("\nRaw State Probabilities (Unrounded):")
-    for state, prob in enumerate(probabilities):
-        state_str = f"|{bin(state)[2:].zfill(circuit.num_qubits)}>"
-        print(f"{state_str}: {prob}")
+    # Print raw probabilities for the basis states that can actually be measured
+    if verbose:
+        print("\nRaw State Probabilities (Unrounded):")
+        for state in np.flatnonzero(probabilities > 1e-12):
+            print(f"|{state:0{circuit.num_qubits}b}>: {probabilities[state]}")
 
     # Verify probability normalization
     total_probability = np.sum(probabilities)
@@ -33,17 +35,16 @@ def run_simulation(circuit, num_simulations=100):
         raise ValueError("Probabilities are not normalized. Check the gate implementations.")
 
     # Perform measurements
-    measurement_results = np.random.choice(
-        len(probabilities), size=num_simulations, p=probabilities
-    )
+    measurement_results = circuit.measure_samples(num_simulations, rng)
 
     # Count the occurrences of each measurement outcome
-    counts = Counter(measurement_results)
+    states, counts = np.unique(measurement_results, return_counts=True)
 
-    # Format results
+    # Format results, parsing the bitstring format spec once
+    spec = f"0{circuit.num_qubits}b"
     formatted_counts = {
-        f"|{bin(state)[2:].zfill(circuit.num_qubits)}>": count
-        for state, count in counts.items()
+        f"|{format(state, spec)}>": count
+        for state, count in zip(states.tolist(), counts.tolist())
     }
 
     # Print the measurement results
@@ -54,7 +55,7 @@ def run_simulation(circuit, num_simulations=100):
     return formatted_counts
 
 
-def run_noisy_simulation(circuit, num_simulations=1000, gate_error_prob=0.01, measurement_error_prob=0.02):
+def run_noisy_simulation(circuit, num_simulations=1000, gate_error_prob=0.01, measurement_error_prob=0.02, rng=None):
     """
     Simulate a quantum circuit with noise, including gate errors and measurement noise.
 
@@ -62,46 +63,54 @@ def run_noisy_simulation(circuit, num_simulations=1000, gate_error_prob=0.01, me
     :param num_simulations: Number of times to simulate the circuit.
     :param gate_error_prob: Probability of introducing random errors in gate operations.
     :param measurement_error_prob: Probability of introducing random errors in measurements.
+    :param rng: Optional numpy random Generator. A new default generator is used if omitted.
     :return: A dictionary with counts of each measured outcome.
     """
-    # Apply all gates in the circuit with gate errors
-    state = circuit.state
-    for gate in circuit.gates:
-        if random.random() < gate_error_prob:
-            # Introduce random gate error: Add a small random perturbation to the operator
-            noise = np.random.normal(0, 0.01, gate.get_operator(circuit.num_qubits).shape)
-            noisy_operator = gate.get_operator(circuit.num_qubits) + noise
-            state = noisy_operator @ state
+    if rng is None:
+        rng = np.random.default_rng()
+    gate_errors = rng.random(len(circuit.gates)) < gate_error_prob
+
+    # Apply all gates in the circuit with gate errors, starting from |0...0> rather than
+    # circuit.state, which run_simulation may already have evolved through the same gates
+    state = np.zeros(2 ** circuit.num_qubits, dtype=circuit.dtype)
+    state[0] = 1
+    for gate, gate_error in zip(circuit.gates, gate_errors):
+        if gate_error and len(gate.qubits) == 1:
+            # Introduce random gate error: Perturb the 2x2 matrix and apply it with the gate kernel
+            noisy_gate = Gate(name=gate.name, qubits=gate.qubits)
+            noisy_gate.matrix = gate.matrix + rng.normal(0, 0.01, gate.matrix.shape)
+            state = noisy_gate.apply(state)
+        elif gate_error:
+            # Multi-qubit kernels do not read the matrix, so perturb the full operator instead
+            # Gate matrices are complex128; keep the state in the circuit precision
+            operator = gate.get_operator(circuit.num_qubits).astype(state.dtype, copy=False)
+            noise = rng.normal(0, 0.01, operator.shape).astype(operator.real.dtype)
+            state = (operator + noise) @ state
         else:
-            state = gate.get_operator(circuit.num_qubits) @ state
+            # Noise-free gates never need the dense operator
+            state = gate.apply(state)
 
     # Calculate probabilities of each basis state
-    probabilities = np.abs(state) ** 2
+    probabilities = kernels.probabilities(state)
 
     # Verify probability normalization
     total_probability = np.sum(probabilities)
     if not np.isclose(total_probability, 1.0):
         probabilities /= total_probability  # Normalize in case of noise
 
-    # Perform measurements with measurement noise
-    measurement_results = []
-    for _ in range(num_simulations):
-        # Simulate a noisy measurement
-        true_state = np.random.choice(len(probabilities), p=probabilities)
-        if random.random() < measurement_error_prob:
-            # Flip to a random state due to measurement error
-            noisy_state = random.randint(0, len(probabilities) - 1)
-            measurement_results.append(noisy_state)
-        else:
-            measurement_results.append(true_state)
+    # Perform measurements with measurement noise: a shot flips to a uniformly random state with
+    # probability measurement_error_prob, so all shots come from one mixture distribution
+    noisy_probabilities = (1 - measurement_error_prob) * probabilities + measurement_error_prob / len(probabilities)
+    measurement_results = rng.choice(len(probabilities), size=num_simulations, p=noisy_probabilities)
 
     # Count occurrences of each measurement outcome
-    counts = Counter(measurement_results)
+    states, counts = np.unique(measurement_results, return_counts=True)
 
-    # Format results
+    # Format results, parsing the bitstring format spec once
+    spec = f"0{circuit.num_qubits}b"
     formatted_counts = {
-        f"|{bin(state)[2:].zfill(circuit.num_qubits)}>": count
-        for state, count in counts.items()
+        f"|{format(state, spec)}>": count
+        for state, count in zip(states.tolist(), counts.tolist())
     }
 
     # Print the noisy results
@@ -112,7 +121,7 @@ def run_noisy_simulation(circuit, num_simulations=1000, gate_error_prob=0.01, me
     return formatted_counts
 
 def grover_3_qubits_with_simulation():
-    # Create a quantum circuit with 3 qubits (2 data qubits + 1 auxiliary qubit)
+    # Create a quantum circuit with 2 data qubits
     qc = QuantumCircuit(num_qubits=2)
 
     # Step 1: Apply Hadamard gates to the data qubits to create a superposition
@@ -136,7 +145,7 @@ def grover_3_qubits_with_simulation():
     # Print the circuit structure (if needed for debugging)
     print(qc)
 
-    run_simulation(qc, num_simulations=100)
+    run_simulation(qc, num_simulations=100, verbose=True)
     run_noisy_simulation(qc, num_simulations=1000, gate_error_prob=0.05, measurement_error_prob=0.1)
 
 
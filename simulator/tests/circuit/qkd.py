@@ -1,44 +1,42 @@
-import random
+import numpy as np
 
-from simulator.circuit.quantum_circuit import QuantumCircuit
 from simulator.gates import X, Hadamard
+from simulator.gates.dtype import get_dtype
+from simulator.tests.circuit._qkd import apply_gate, measure
+
+# Build the gates once and apply them to every selected qubit in one kernel call
+_X_GATE = X(qubits=[0])
+_H_GATE = Hadamard(qubits=[0])
+
+rng = np.random.default_rng()
 
 
 def prepare_qubits(num_bits):
     """
     Step 1: Alice prepares random bits and bases.
-    :return: Tuple (alice_bits, alice_bases, alice_circuits)
+    :return: Tuple (alice_bits, alice_bases, alice_states)
     """
-    alice_bits = [random.randint(0, 1) for _ in range(num_bits)]
-    alice_bases = [random.choice(['Z', 'X']) for _ in range(num_bits)]
-    alice_circuits = []
+    alice_bits = rng.integers(0, 2, size=num_bits, dtype=np.uint8)
+    alice_bases = rng.choice(['Z', 'X'], size=num_bits)
 
-    for i in range(num_bits):
-        qc = QuantumCircuit(num_qubits=1)
-        if alice_bits[i] == 1:
-            qc.add_gate(X(qubits=[0]))  # Prepare |1> state
-        if alice_bases[i] == 'X':
-            qc.add_gate(Hadamard(qubits=[0]))  # Apply Hadamard for X-basis
-        alice_circuits.append(qc)
+    alice_states = np.zeros((num_bits, 2), dtype=get_dtype())
+    alice_states[:, 0] = 1
+    apply_gate(alice_states, _X_GATE, alice_bits == 1)  # Prepare |1> states
+    apply_gate(alice_states, _H_GATE, alice_bases == 'X')  # Apply Hadamard for X-basis
 
-    return alice_bits, alice_bases, alice_circuits
+    return alice_bits, alice_bases, alice_states
 
-def measure_qubits(alice_circuits, num_bits):
+def measure_qubits(alice_states, num_bits):
     """
     Step 2: Bob measures qubits with random bases.
     :param num_bits: number of bits to measure.
-    :param alice_circuits: Circuits prepared by Alice.
+    :param alice_states: States prepared by Alice.
     :return: Tuple (bob_bases, bob_results)
     """
-    bob_bases = [random.choice(['Z', 'X']) for _ in range(num_bits)]
-    bob_results = []
+    bob_bases = rng.choice(['Z', 'X'], size=num_bits)
 
-    for i, qc in enumerate(alice_circuits):
-        if bob_bases[i] == 'X':
-            qc.add_gate(Hadamard(qubits=[0]))  # Change basis to X if needed
-        qc.apply()
-        _, measured_bit = qc.measure_state()
-        bob_results.append(measured_bit)
+    apply_gate(alice_states, _H_GATE, bob_bases == 'X')  # Change basis to X if needed
+    bob_results = measure(alice_states, rng)
 
     return bob_bases, bob_results
 
@@ -47,11 +45,7 @@ def compare_bases(alice_bases, bob_bases, alice_bits, bob_results, num_bits):
     Step 3: Alice and Bob compare bases.
     :return: The shared key.
     """
-    shared_key = [
-        alice_bits[i]
-        for i in range(num_bits)
-        if alice_bases[i] == bob_bases[i]
-    ]
+    shared_key = alice_bits[alice_bases == bob_bases].tolist()
     return shared_key
 
 """
@@ -59,16 +53,16 @@ Run the full QKD simulation using your library.
 """
 # Step 1: Alice prepares qubits
 num_bits = 10
-alice_bits, alice_bases, alice_circuits = prepare_qubits(num_bits)
+alice_bits, alice_bases, alice_states = prepare_qubits(num_bits)
 
 # Step 2: Bob measures qubits
-bob_bases, bob_results = measure_qubits(alice_circuits, num_bits)
+bob_bases, bob_results = measure_qubits(alice_states, num_bits)
 
 # Step 3: Compare bases and extract the shared key
 shared_key = compare_bases(alice_bases, bob_bases, alice_bits, bob_results, num_bits)
 
-print("Alice's Bits: ", alice_bits)
-print("Alice's Bases: ", alice_bases)
-print("Bob's Bases:   ", bob_bases)
-print("Bob's Results: ", bob_results)
+print("Alice's Bits: ", alice_bits.tolist())
+print("Alice's Bases: ", alice_bases.tolist())
+print("Bob's Bases:   ", bob_bases.tolist())
+print("Bob's Results: ", bob_results.tolist())
 print("Shared Key:    ", shared_key)
\ No newline at end of file
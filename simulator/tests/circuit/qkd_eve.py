@@ -1,7 +1,12 @@
-import random
+import numpy as np
 
-from simulator.circuit.quantum_circuit import QuantumCircuit
 from simulator.gates import X, Hadamard
+from simulator.gates.dtype import get_dtype
+from simulator.tests.circuit._qkd import apply_gate, measure
+
+# Build the gates once and apply them to every selected qubit in one kernel call
+_X_GATE = X(qubits=[0])
+_H_GATE = Hadamard(qubits=[0])
 
 
 class QKDWithEavesdropping:
@@ -11,67 +16,63 @@ class QKDWithEavesdropping:
         :param num_bits: Number of qubits to simulate.
         """
         self.num_bits = num_bits
+        self.rng = np.random.default_rng()
+
+    def prepare_states(self, bits, bases):
+        """
+        Prepare one qubit per bit, held together as rows of a single (num_bits, 2) array.
+        :param bits: Array of bits to encode.
+        :param bases: Array of 'Z'/'X' bases to encode them in.
+        :return: Array of shape (num_bits, 2) with the one-qubit states.
+        """
+        states = np.zeros((self.num_bits, 2), dtype=get_dtype())
+        states[:, 0] = 1
+        apply_gate(states, _X_GATE, bits == 1)  # Prepare |1> states
+        apply_gate(states, _H_GATE, bases == 'X')  # Apply Hadamard for X-basis
+        return states
+
+    def measure(self, states, bases):
+        """
+        Measure every qubit in its given basis.
+        :param states: Array of shape (num_bits, 2) with the one-qubit states.
+        :param bases: Array of 'Z'/'X' measurement bases.
+        :return: Array of measured bits.
+        """
+        apply_gate(states, _H_GATE, bases == 'X')  # Change to X-basis if needed
+        return measure(states, self.rng)
 
     def prepare_qubits(self):
         """
         Step 1: Alice prepares random bits and bases.
-        :return: Tuple (alice_bits, alice_bases, alice_circuits)
+        :return: Tuple (alice_bits, alice_bases, alice_states)
         """
-        alice_bits = [random.randint(0, 1) for _ in range(self.num_bits)]
-        alice_bases = [random.choice(['Z', 'X']) for _ in range(self.num_bits)]
-        alice_circuits = []
-
-        for i in range(self.num_bits):
-            qc = QuantumCircuit(num_qubits=1)
-            if alice_bits[i] == 1:
-                qc.add_gate(X(qubits=[0]))  # Prepare |1> state
-            if alice_bases[i] == 'X':
-                qc.add_gate(Hadamard(qubits=[0]))  # Apply Hadamard for X-basis
-            alice_circuits.append(qc)
+        alice_bits = self.rng.integers(0, 2, size=self.num_bits, dtype=np.uint8)
+        alice_bases = self.rng.choice(['Z', 'X'], size=self.num_bits)
+        alice_states = self.prepare_states(alice_bits, alice_bases)
 
-        return alice_bits, alice_bases, alice_circuits
+        return alice_bits, alice_bases, alice_states
 
-    def eavesdrop(self, alice_circuits):
+    def eavesdrop(self, alice_states):
         """
         Step 2: Eve intercepts and measures qubits with random bases.
-        :param alice_circuits: Circuits prepared by Alice.
-        :return: Eve-modified circuits sent to Bob.
+        :param alice_states: States prepared by Alice.
+        :return: Eve-modified states sent to Bob.
         """
-        eve_bases = [random.choice(['Z', 'X']) for _ in range(self.num_bits)]
-        modified_circuits = []
-
-        for i, qc in enumerate(alice_circuits):
-            # Eve measures in a random basis
-            if eve_bases[i] == 'X':
-                qc.add_gate(Hadamard(qubits=[0]))  # Change to X-basis
-            qc.apply()
-            _, measured_bit = qc.measure_state()  # Eve measures the qubit
+        # Eve measures in a random basis
+        eve_bases = self.rng.choice(['Z', 'X'], size=self.num_bits)
+        eve_bits = self.measure(alice_states, eve_bases)
 
-            # Eve resends the qubit (modified state) to Bob
-            new_qc = QuantumCircuit(num_qubits=1)
-            if measured_bit == 1:
-                new_qc.add_gate(X(qubits=[0]))  # Prepare |1> state
-            if eve_bases[i] == 'X':
-                new_qc.add_gate(Hadamard(qubits=[0]))  # Apply Hadamard if in X-basis
-            modified_circuits.append(new_qc)
+        # Eve resends the qubits (modified states) to Bob
+        return self.prepare_states(eve_bits, eve_bases)
 
-        return modified_circuits
-
-    def measure_qubits(self, circuits_sent_to_bob):
+    def measure_qubits(self, states_sent_to_bob):
         """
         Step 3: Bob measures qubits with random bases.
-        :param circuits_sent_to_bob: Circuits received by Bob.
+        :param states_sent_to_bob: States received by Bob.
         :return: Tuple (bob_bases, bob_results)
         """
-        bob_bases = [random.choice(['Z', 'X']) for _ in range(self.num_bits)]
-        bob_results = []
-
-        for i, qc in enumerate(circuits_sent_to_bob):
-            if bob_bases[i] == 'X':
-                qc.add_gate(Hadamard(qubits=[0]))  # Change to X-basis if needed
-            qc.apply()
-            _, measured_bit = qc.measure_state()
-            bob_results.append(measured_bit)
+        bob_bases = self.rng.choice(['Z', 'X'], size=self.num_bits)
+        bob_results = self.measure(states_sent_to_bob, bob_bases)
 
         return bob_bases, bob_results
 
@@ -80,60 +81,55 @@ class QKDWithEavesdropping:
         Step 4: Alice and Bob compare bases and compute the error rate on a random subset of matching bits.
         :return: The shared key, error rate, and the test subset used for error detection.
         """
-        matching_indices = [
-            i for i in range(self.num_bits) if alice_bases[i] == bob_bases[i]
-        ]
-        shared_key = [alice_bits[i] for i in matching_indices]
-        bob_key = [bob_results[i] for i in matching_indices]
+        matching_indices = np.flatnonzero(alice_bases == bob_bases)
+        shared_key = alice_bits[matching_indices]
+        bob_key = bob_results[matching_indices]
 
-        if matching_indices:
+        if len(matching_indices):
             # Select a random subset of matching indices for error rate calculation
             subset_size = max(1, len(matching_indices) // 4)  # Use 25% of the matching bits
-            subset_indices = random.sample(range(len(matching_indices)), subset_size)
+            subset_indices = self.rng.choice(len(matching_indices), size=subset_size, replace=False)
 
             # Retrieve the indices in terms of the original bits
-            test_indices = [matching_indices[i] for i in subset_indices]
-
-            test_alice_bits = [shared_key[i] for i in subset_indices]
-            test_bob_bits = [bob_key[i] for i in subset_indices]
+            test_indices = matching_indices[subset_indices].tolist()
 
-            errors = sum(1 for i in range(subset_size) if test_alice_bits[i] != test_bob_bits[i])
-            error_rate = errors / subset_size if subset_size else 0
+            errors = np.count_nonzero(shared_key[subset_indices] != bob_key[subset_indices])
+            error_rate = errors / subset_size
 
             # Remove the test bits from the shared key for final usage
-            final_shared_key = [
-                shared_key[i] for i in range(len(shared_key)) if i not in subset_indices
-            ]
+            keep = np.ones(len(shared_key), dtype=bool)
+            keep[subset_indices] = False
+            final_shared_key = shared_key[keep].tolist()
         else:
             final_shared_key = []
             error_rate = 0
             test_indices = []
 
         print(f"Tested Indices (Original): {test_indices}")
-        return final_shared_key, bob_key, error_rate, test_indices
+        return final_shared_key, bob_key.tolist(), error_rate, test_indices
 
     def run(self):
         """
         Run the full QKD simulation with Eve.
         """
         # Step 1: Alice prepares qubits
-        alice_bits, alice_bases, alice_circuits = self.prepare_qubits()
+        alice_bits, alice_bases, alice_states = self.prepare_qubits()
 
         # Step 2: Eve intercepts and modifies qubits
-        circuits_sent_to_bob = self.eavesdrop(alice_circuits)
+        states_sent_to_bob = self.eavesdrop(alice_states)
 
         # Step 3: Bob measures the qubits
-        bob_bases, bob_results = self.measure_qubits(circuits_sent_to_bob)
+        bob_bases, bob_results = self.measure_qubits(states_sent_to_bob)
 
         # Step 4: Compare bases and extract the shared key
         shared_key, bob_key, error_rate, test_indices = self.compare_bases(
             alice_bases, bob_bases, alice_bits, bob_results
         )
 
-        print("Alice's Bits:   ", alice_bits)
-        print("Alice's Bases:  ", alice_bases)
-        print("Bob's Bases:    ", bob_bases)
-        print("Bob's Results:  ", bob_results)
+        print("Alice's Bits:   ", alice_bits.tolist())
+        print("Alice's Bases:  ", alice_bases.tolist())
+        print("Bob's Bases:    ", bob_bases.tolist())
+        print("Bob's Results:  ", bob_results.tolist())
         print("Shared Key:     ", shared_key)
         print("Bob's Key:      ", bob_key)
         print(f"Tested Indices:     ", test_indices)
@@ -0,0 +1,118 @@
+import numpy as np
+
+from simulator.circuit.quantum_circuit import QuantumCircuit
+from simulator.gates import Hadamard, T, S, X, CNOT, Identity, Rx, Rz
+
+
+def test_compile_fuses_single_qubit_runs():
+    qc = QuantumCircuit(num_qubits=2)
+    qc.add_gate(Hadamard(qubits=[0]))
+    qc.add_gate(T(qubits=[0]))
+    qc.add_gate(S(qubits=[1]))
+    qc.add_gate(X(qubits=[1]))
+    qc.add_gate(CNOT(0, 1))
+    qc.add_gate(Hadamard(qubits=[1]))
+
+    compiled = qc.compile()
+
+    # H*T on qubit 0 and S*X on qubit 1 each become one gate before the CNOT
+    assert len(compiled) == 4
+    assert isinstance(compiled[2], CNOT)
+
+    # Fusion must not change the resulting state
+    expected = qc.state.copy()
+    for gate in qc.gates:
+        expected = gate.apply(expected)
+    qc.apply()
+    assert np.allclose(qc.state, expected), "Fused circuit produced a different state."
+
+
+def test_compile_keeps_order_across_entangling_gates():
+    qc = QuantumCircuit(num_qubits=2)
+    qc.add_gate(X(qubits=[0]))
+    qc.add_gate(CNOT(0, 1))
+    qc.add_gate(X(qubits=[0]))
+
+    # The two X gates are separated by a CNOT on the same qubit and must not be fused
+    assert len(qc.compile()) == 3
+
+    qc.apply()
+    assert np.allclose(qc.state, np.array([0, 1, 0, 0], dtype=complex))
+
+
+def test_apply_reuses_compiled_gates():
+    qc = QuantumCircuit(num_qubits=1)
+    qc.add_gate(Hadamard(qubits=[0]))
+    qc.add_gate(T(qubits=[0]))
+    qc.apply()
+    compiled = qc._compiled_gates[1]
+
+    # Rebuilding the circuit with different gates must recompile it
+    qc.reset()
+    qc.add_gate(Hadamard(qubits=[0]))
+    qc.add_gate(X(qubits=[0]))
+    qc.apply()
+    assert qc._compiled_gates[1] is not compiled, "Cache was not invalidated after the gates changed."
+    assert np.allclose(qc.state, X(qubits=[0]).matrix @ Hadamard(qubits=[0]).matrix @ np.array([1, 0]))
+
+    # Re-applying the same circuit must not recompile it
+    compiled = qc._compiled_gates[1]
+    qc.apply()
+    assert qc._compiled_gates[1] is compiled, "Compiled gates were rebuilt for an unchanged circuit."
+
+
+def test_compile_drops_noop_gates():
+    qc = QuantumCircuit(num_qubits=2)
+    qc.add_gate(Identity(qubits=[0]))
+    qc.add_gate(Rx(theta=0.0, qubits=[1]))
+    qc.add_gate(CNOT(0, 1))
+    qc.add_gate(Rz(theta=0.0, qubits=[0]))
+
+    # Only the CNOT does any work; the circuit itself still lists every gate
+    assert len(qc.compile()) == 1
+    assert len(qc.gates) == 4
+
+
+def test_compile_cancels_self_inverse_pairs():
+    qc = QuantumCircuit(num_qubits=2)
+    qc.add_gate(Hadamard(qubits=[0]))
+    qc.add_gate(Hadamard(qubits=[1]))
+    qc.add_gate(Hadamard(qubits=[1]))
+    qc.add_gate(CNOT(0, 1))
+    qc.add_gate(CNOT(0, 1))
+
+    # H H on qubit 1 multiplies out to I and the CNOT pair cancels, leaving only H on qubit 0
+    compiled = qc.compile()
+    assert len(compiled) == 1
+    assert compiled[0].qubits == [0]
+
+    qc.apply()
+    assert np.allclose(qc.state, np.array([1, 0, 1, 0]) / np.sqrt(2))
+
+
+def test_compile_keeps_small_rotations():
+    qc = QuantumCircuit(num_qubits=2, dtype=np.complex128)
+    qc.add_gate(Hadamard(qubits=[0]))
+    qc.add_gate(CNOT(0, 1))
+    qc.add_gate(Rz(theta=1e-5, qubits=[0]))
+    qc.add_gate(Rz(theta=1e-5, qubits=[0]))
+    qc.add_gate(Rx(theta=1e-6, qubits=[1]))
+    qc.add_gate(Rx(theta=1e-6, qubits=[1]))
+
+    # Tiny but nonzero rotations are not the identity and must not be fused away
+    assert len(qc.compile()) == 4
+
+    expected = np.array([1, 0, 0, 0], dtype=complex)
+    for gate in qc.gates:
+        expected = gate.get_operator(2) @ expected
+    qc.apply()
+    assert np.max(np.abs(qc.state - expected)) < 1e-12
+
+
+if __name__ == "__main__":
+    test_compile_fuses_single_qubit_runs()
+    test_compile_keeps_order_across_entangling_gates()
+    test_apply_reuses_compiled_gates()
+    test_compile_drops_noop_gates()
+    test_compile_cancels_self_inverse_pairs()
+    test_compile_keeps_small_rotations()
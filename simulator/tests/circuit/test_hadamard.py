@@ -1,3 +1,5 @@
+from collections import Counter
+
 import numpy as np
 
 from simulator.circuit.quantum_circuit import QuantumCircuit
@@ -14,15 +16,18 @@ def test_double_hadamard():
     qc.add_gate(Hadamard(qubits=[1]))
 
 
-    # Apply the circuit
+    # Apply the circuit once, then restore the prepared state before every measurement
+    # instead of rebuilding and re-applying the gates
+    qc.apply()
+    prepared_state = qc.state.copy()
+
+    measured_basis_states = []
     for x in range(1000):
-        qc.apply()
-        print(qc.measure_state())
-        qc.reset()
-        qc.add_gate(Hadamard(qubits=[0]))
-        qc.add_gate(Hadamard(qubits=[1]))
-        qc.add_gate(Hadamard(qubits=[1]))
+        qc.reset_to(prepared_state)
+        measured_basis_states.append(qc.measure_state()[1])
+    qc.reset_to(prepared_state)
 
+    print("Measurement results (counts):", Counter(int(state) for state in measured_basis_states))
     print("State vector after applying gates:", qc.state)
     # Expected state: Apply Hadamard to |0> and |1> sequentially
     expected_state = np.array([1/np.sqrt(2), 0, 1/np.sqrt(2), 0], dtype=complex)
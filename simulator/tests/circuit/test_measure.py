@@ -17,20 +17,11 @@ def test_complex_circuit_with_measurement():
     qc.draw()
     print("State vector after applying gates:", qc.state)
 
+    # The circuit is deterministic, so draw every shot from the prepared state at once
+    # instead of resetting, re-adding and re-applying the gates per measurement
     num_measurements = 1000
-    measurement_results = []
-
-    for _ in range(num_measurements):
-        collapsed_state, measured_basis_state = qc.measure_state()
-        measurement_results.append(measured_basis_state)
-
-        # Reset the circuit to its original state for the next measurement
-        qc.reset()
-        qc.add_gate(Hadamard(qubits=[0]))
-        qc.add_gate(CNOT(0,1))
-        qc.apply()
-
-    counts = Counter(measurement_results)
+    state_counts = qc.sample(num_measurements, rng=np.random.default_rng(0))
+    counts = Counter({int(state): int(state_counts[state]) for state in np.flatnonzero(state_counts)})
 
     probabilities = {state: count / num_measurements for state, count in counts.items()}
 
@@ -43,9 +34,36 @@ def test_complex_circuit_with_measurement():
             f"Probability for state {state} deviates from expected value."
         )
 
+    # A single projective measurement collapses onto one of the Bell state components
+    collapsed_state, measured_basis_state = qc.measure_state()
+    assert measured_basis_state in (0, 3)
+    assert np.isclose(collapsed_state[measured_basis_state], 1)
+
     print("Test passed: Empirical probabilities match expected values.")
 
 
+def test_sample_bell_state():
+    qc = QuantumCircuit(num_qubits=2)
+    qc.add_gate(Hadamard(qubits=[0]))
+    qc.add_gate(CNOT(0, 1))
+    qc.apply()
+
+    num_shots = 1000
+    counts = qc.sample(num_shots, rng=np.random.default_rng(0))
+
+    # Only |00> and |11> can be measured, and sampling must not collapse the state
+    assert counts.sum() == num_shots
+    assert counts[1] == 0 and counts[2] == 0, "Sampled a basis state with zero probability."
+    assert np.isclose(counts[0] / num_shots, 0.5, atol=0.1)
+    assert np.allclose(qc.state, np.array([1, 0, 0, 1], dtype=complex) / np.sqrt(2))
+
+    # Per-shot outcomes come from the same distribution
+    outcomes = qc.measure_samples(num_shots, rng=np.random.default_rng(0))
+    assert outcomes.shape == (num_shots,)
+    assert set(outcomes.tolist()) <= {0, 3}
+
+
 if __name__ == "__main__":
     test_complex_circuit_with_measurement()
+    test_sample_bell_state()
 
@@ -0,0 +1,59 @@
+import numpy as np
+
+from simulator.circuit.quantum_circuit import QuantumCircuit
+from simulator.gates import CNOT, Hadamard, Rx
+
+
+def test_double_precision_circuit():
+    # A complex128 circuit must not inherit single-precision rounding from the gate matrices
+    qc = QuantumCircuit(num_qubits=1, dtype=np.complex128)
+    qc.add_gate(Hadamard(qubits=[0]))
+    qc.apply()
+
+    assert qc.state.dtype == np.complex128
+    assert np.max(np.abs(qc.state - np.sqrt(0.5))) < 1e-15
+
+
+def test_double_precision_deep_circuit_stays_normalized():
+    qc = QuantumCircuit(num_qubits=3, dtype=np.complex128)
+    for layer in range(200):
+        qc.add_gate(Rx(theta=0.1 * (layer + 1), qubits=[layer % 3]))
+        qc.add_gate(CNOT(layer % 3, (layer + 1) % 3))
+    qc.apply()
+
+    assert abs(np.vdot(qc.state, qc.state).real - 1) < 1e-12
+    # Measuring must not trip numpy's probability-sum check
+    qc.measure_state()
+
+
+def test_single_precision_deep_circuit_can_be_measured():
+    qc = QuantumCircuit(num_qubits=3, dtype=np.complex64)
+    for layer in range(200):
+        qc.add_gate(Rx(theta=0.1 * (layer + 1), qubits=[layer % 3]))
+        qc.add_gate(CNOT(layer % 3, (layer + 1) % 3))
+    qc.apply()
+
+    _, measured_basis_state = qc.measure_state()
+    assert 0 <= measured_basis_state < 8
+
+
+def test_add_gate_does_not_change_shared_gate():
+    # Adding one gate object to circuits of different precision must leave its matrix untouched
+    hadamard = Hadamard(qubits=[0])
+    double_circuit = QuantumCircuit(num_qubits=1, dtype=np.complex128)
+    single_circuit = QuantumCircuit(num_qubits=1, dtype=np.complex64)
+    double_circuit.add_gate(hadamard)
+    single_circuit.add_gate(hadamard)
+
+    assert hadamard.matrix.dtype == np.complex128
+    double_circuit.apply()
+    single_circuit.apply()
+    assert single_circuit.state.dtype == np.complex64
+    assert np.max(np.abs(double_circuit.state - np.sqrt(0.5))) < 1e-15
+
+
+if __name__ == "__main__":
+    test_double_precision_circuit()
+    test_double_precision_deep_circuit_stays_normalized()
+    test_single_precision_deep_circuit_can_be_measured()
+    test_add_gate_does_not_change_shared_gate()
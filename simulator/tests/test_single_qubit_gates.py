@@ -0,0 +1,138 @@
+import cmath
+import math
+from functools import partial
+
+import numpy as np
+import pytest
+
+from simulator.gates import Hadamard, Identity, Ph, Rx, Ry, Rz, S, T, X, Y, Z
+from simulator.gates.gate import Gate
+from simulator.tests._gate_harness import close
+
+_INV_SQRT2 = math.sqrt(0.5)
+_EXP_IPI_8 = cmath.exp(1j * math.pi / 8)
+_EXP_IPI_4 = cmath.exp(1j * math.pi / 4)
+
+# (gate, expected states for |0> and |1> as rows, whether the result is exact), built once at import.
+# Gates with entries in {0, +-1, +-i} map basis states to exact amplitudes, so they are compared bit for bit.
+_CASES = [(gate, np.array(expected, dtype=complex), exact) for gate, expected, exact in [
+    (Hadamard(qubits=[0]), [[_INV_SQRT2, _INV_SQRT2], [_INV_SQRT2, -_INV_SQRT2]], False),
+    (Rx(theta=math.pi / 2, qubits=[0]), [[_INV_SQRT2, -1j * _INV_SQRT2], [-1j * _INV_SQRT2, _INV_SQRT2]], False),
+    (Ry(theta=math.pi / 2, qubits=[0]), [[_INV_SQRT2, _INV_SQRT2], [-_INV_SQRT2, _INV_SQRT2]], False),
+    (Rz(theta=math.pi / 4, qubits=[0]), [[_EXP_IPI_8.conjugate(), 0], [0, _EXP_IPI_8]], False),
+    (S(qubits=[0]), [[1, 0], [0, 1j]], True),
+    (T(qubits=[0]), [[1, 0], [0, _EXP_IPI_4]], False),
+    (X(qubits=[0]), [[0, 1], [1, 0]], True),
+    (Y(qubits=[0]), [[0, 1j], [-1j, 0]], True),
+    (Z(qubits=[0]), [[1, 0], [0, -1]], True),
+    (Identity(qubits=[0]), [[1, 0], [0, 1]], True),
+    (Ph(delta=math.pi / 2, qubits=[0]), [[1, 0], [0, 1j]], False),
+]]
+
+
+# |0> and |1> of a single qubit as rows in complex64 and complex128, whatever get_dtype() returns.
+# Read-only, so a gate that writes into its input fails loudly instead of corrupting the other cases.
+_BASIS_SINGLE = np.eye(2, dtype=np.complex64)
+_BASIS_SINGLE.setflags(write=False)
+_BASIS_DOUBLE = np.eye(2, dtype=np.complex128)
+_BASIS_DOUBLE.setflags(write=False)
+
+# One single-qubit buffer reused by every apply(..., out=) call
+_OUTPUT_BUFFER = np.empty(2, dtype=np.complex64)
+
+
+@pytest.mark.parametrize("gate,expected_states,exact", _CASES, ids=[gate.name for gate, _, _ in _CASES])
+def test_single_qubit_gate(gate, expected_states, exact):
+    check = np.array_equal if exact else close
+
+    # apply() must agree with the matrix on both basis states, with and without an output buffer
+    for state_vector, expected_state_vector in zip(_BASIS_SINGLE, expected_states):
+        new_state_vector = gate.apply(state_vector)
+        assert new_state_vector.dtype == np.complex64, f"{gate.name} gate changed the state precision."
+        assert check(new_state_vector, expected_state_vector), f"{gate.name} gate apply failed."
+
+        assert gate.apply(state_vector, out=_OUTPUT_BUFFER) is _OUTPUT_BUFFER
+        assert check(_OUTPUT_BUFFER, expected_state_vector), f"{gate.name} gate apply failed with out=."
+
+
+@pytest.mark.parametrize("gate,expected_states,exact", _CASES, ids=[gate.name for gate, _, _ in _CASES])
+def test_single_qubit_gate_double_precision(gate, expected_states, exact):
+    # complex128 states must stay complex128 and match the expected states to double precision
+    check = np.array_equal if exact else partial(close, tol=1e-12)
+
+    for state_vector, expected_state_vector in zip(_BASIS_DOUBLE, expected_states):
+        new_state_vector = gate.apply(state_vector)
+        assert new_state_vector.dtype == np.complex128, f"{gate.name} gate changed the state precision."
+        assert check(new_state_vector, expected_state_vector), f"{gate.name} gate apply failed."
+
+
+@pytest.mark.parametrize("case_gate", [case[0] for case in _CASES], ids=[gate.name for gate, _, _ in _CASES])
+@pytest.mark.parametrize("target_qubit", [0, 3, 4])
+def test_single_qubit_gate_out_buffer(case_gate, target_qubit):
+    # Targets 0, 3 and 4 of a 5-qubit state cover the broadcast and row-block kernels
+    rng = np.random.default_rng(target_qubit)
+    state_vector = (rng.normal(size=32) + 1j * rng.normal(size=32)).astype(np.complex64)
+    gate = Gate(name=case_gate.name, qubits=[target_qubit])
+    gate.matrix = case_gate.matrix
+    out = np.empty_like(state_vector)
+
+    assert gate.apply(state_vector, out=out) is out
+    assert close(out, gate.apply(state_vector)), f"{gate.name} gate apply failed with out=."
+
+
+def test_single_qubit_gate_real_state():
+    # Real and integer states are promoted to complex instead of truncating the gate matrix
+    assert close(Hadamard(qubits=[0]).apply(np.array([1, 0])), [_INV_SQRT2, _INV_SQRT2])
+    assert np.array_equal(S(qubits=[1]).apply(np.array([0., 1, 0, 0])), [0, 1j, 0, 0])
+
+    state_vector = np.zeros(8)
+    state_vector[0] = 1
+    expected_state_vector = np.zeros(8, dtype=complex)
+    expected_state_vector[1] = -1j
+    assert close(Rx(theta=math.pi, qubits=[2]).apply(state_vector), expected_state_vector)
+
+
+def test_hadamard_operator():
+    # Qubit 0 is the most significant, so H on qubit 0 of 2 qubits is H (x) I
+    hadamard_gate = Hadamard(qubits=[0])
+    expected_operator = np.kron(hadamard_gate.matrix, np.eye(2))
+
+    assert np.allclose(hadamard_gate.get_operator(2), expected_operator), "Hadamard operator acts on the wrong qubit."
+
+    # The operator must agree with apply()
+    state_vector = np.array([0.5, 0.5j, -0.5, 0.5], dtype=complex)
+    assert np.allclose(hadamard_gate.get_operator(2) @ state_vector, hadamard_gate.apply(state_vector))
+
+
+def test_pauli_x_gate_middle_qubit():
+    # |000> with X on qubit 1 (qubit 0 is the most significant) gives |010>
+    state_vector = np.zeros(8, dtype=complex)
+    state_vector[0] = 1
+
+    new_state_vector = X(qubits=[1]).apply(state_vector)
+
+    expected_state_vector = np.zeros(8, dtype=complex)
+    expected_state_vector[0b010] = 1
+    assert np.array_equal(new_state_vector, expected_state_vector), "Pauli-X gate flipped the wrong qubit."
+
+
+def test_pauli_y_gate_two_qubits():
+    # Y on qubit 1 of (|00> + |01>) / sqrt(2) gives (-i|00> + i|01>) / sqrt(2)
+    state_vector = np.array([1, 1, 0, 0], dtype=complex) * _INV_SQRT2
+
+    new_state_vector = Y(qubits=[1]).apply(state_vector)
+
+    expected_state_vector = np.array([-1j, 1j, 0, 0], dtype=complex) * _INV_SQRT2
+    assert close(new_state_vector, expected_state_vector), "Pauli-Y gate failed on the second qubit."
+    # The input state must be left untouched
+    assert close(state_vector, np.array([1, 1, 0, 0]) * _INV_SQRT2)
+
+
+def test_single_qubit_gate_rejects_multiple_targets():
+    with pytest.raises(ValueError, match="Rx gate requires exactly one target qubit"):
+        Rx(theta=math.pi, qubits=[0, 1]).apply(np.zeros(4, dtype=complex))
+
+
+if __name__ == "__main__":
+    # The gate cases are parametrized, so let pytest expand them
+    pytest.main([__file__])
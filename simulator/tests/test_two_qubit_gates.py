@@ -0,0 +1,104 @@
+import numpy as np
+
+from simulator.gates import CNOT, CZ
+
+
+def test_cnot_gate():
+    # Test CNOT gate with |00⟩ state
+    state_vector = np.array([1, 0, 0, 0], dtype=complex)
+    cnot_gate = CNOT(0,1)
+    new_state_vector = cnot_gate.apply(state_vector)
+    expected_state_vector = np.array([1, 0, 0, 0], dtype=complex)
+    assert np.allclose(new_state_vector, expected_state_vector), "CNOT failed for |00⟩ state."
+
+    # Test CNOT gate with |01⟩ state
+    state_vector = np.array([0, 1, 0, 0], dtype=complex)
+    new_state_vector = cnot_gate.apply(state_vector)
+    expected_state_vector = np.array([0, 1, 0, 0], dtype=complex)
+    assert np.allclose(new_state_vector, expected_state_vector), "CNOT failed for |01⟩ state."
+
+    # Test CNOT gate with |10⟩ state
+    state_vector = np.array([0, 0, 1, 0], dtype=complex)
+    new_state_vector = cnot_gate.apply(state_vector)
+    expected_state_vector = np.array([0, 0, 0, 1], dtype=complex)
+    assert np.allclose(new_state_vector, expected_state_vector), "CNOT failed for |10⟩ state."
+
+    # Test CNOT gate with |11⟩ state
+    state_vector = np.array([0, 0, 0, 1], dtype=complex)
+    new_state_vector = cnot_gate.apply(state_vector)
+    expected_state_vector = np.array([0, 0, 1, 0], dtype=complex)
+    assert np.allclose(new_state_vector, expected_state_vector), "CNOT failed for |11⟩ state."
+
+
+def test_cnot_gate_non_adjacent():
+    # Control on qubit 0, target on qubit 2, qubit 1 left untouched: |101⟩ -> |100⟩
+    state_vector = np.zeros(8, dtype=complex)
+    state_vector[0b101] = 1
+    cnot_gate = CNOT(0, 2)
+    new_state_vector = cnot_gate.apply(state_vector)
+    expected_state_vector = np.zeros(8, dtype=complex)
+    expected_state_vector[0b100] = 1
+    assert np.allclose(new_state_vector, expected_state_vector), "CNOT failed for |101⟩ state."
+
+    # Control below target: control on qubit 2, target on qubit 0: |001⟩ -> |101⟩
+    state_vector = np.zeros(8, dtype=complex)
+    state_vector[0b001] = 1
+    cnot_gate = CNOT(2, 0)
+    new_state_vector = cnot_gate.apply(state_vector)
+    expected_state_vector = np.zeros(8, dtype=complex)
+    expected_state_vector[0b101] = 1
+    assert np.allclose(new_state_vector, expected_state_vector), "CNOT failed for |001⟩ state."
+
+
+def test_cnot_operator():
+    # On 2 qubits the full operator is the textbook CNOT matrix
+    expected_operator = np.array([
+        [1, 0, 0, 0],
+        [0, 1, 0, 0],
+        [0, 0, 0, 1],
+        [0, 0, 1, 0]
+    ], dtype=complex)
+    assert np.allclose(CNOT(0, 1).get_operator(2), expected_operator), "CNOT operator is wrong on 2 qubits."
+
+    # On 3 qubits the operator must agree with apply()
+    state_vector = np.arange(8, dtype=complex)
+    cnot_gate = CNOT(2, 0)
+    assert np.allclose(cnot_gate.get_operator(3) @ state_vector, cnot_gate.apply(state_vector)), "CNOT operator disagrees with apply()."
+
+
+def test_cz_gate():
+    # Only the |11⟩ amplitude picks up a -1 phase
+    state_vector = np.array([1, 1, 1, 1], dtype=complex) / 2
+    new_state_vector = CZ(qubits=[0, 1]).apply(state_vector)
+    expected_state_vector = np.array([1, 1, 1, -1], dtype=complex) / 2
+    assert np.allclose(new_state_vector, expected_state_vector), "CZ failed for the uniform superposition."
+
+
+def test_cz_gate_non_adjacent():
+    # CZ(0, 2) on 3 qubits flips |101⟩ and |111⟩ only
+    state_vector = np.ones(8, dtype=complex)
+    new_state_vector = CZ(qubits=[0, 2]).apply(state_vector)
+    expected_state_vector = np.ones(8, dtype=complex)
+    expected_state_vector[[0b101, 0b111]] = -1
+    assert np.allclose(new_state_vector, expected_state_vector), "CZ failed for non-adjacent qubits."
+    assert np.allclose(CZ(qubits=[0, 2]).get_operator(3), np.diag(expected_state_vector)), "CZ operator is wrong."
+
+
+def test_two_qubit_gate_out_buffer():
+    # Two-qubit gates write into a caller-provided buffer like the single-qubit gates do
+    state_vector = np.arange(8, dtype=complex)
+    for gate in (CNOT(0, 2), CZ(qubits=[2, 1])):
+        out = np.empty_like(state_vector)
+        assert gate.apply(state_vector, out=out) is out
+        assert np.array_equal(out, gate.apply(state_vector)), f"{gate.name} gate apply failed with out=."
+    # The input state must be left untouched
+    assert np.array_equal(state_vector, np.arange(8))
+
+
+if __name__ == "__main__":
+    test_cnot_gate()
+    test_cnot_gate_non_adjacent()
+    test_cnot_operator()
+    test_cz_gate()
+    test_cz_gate_non_adjacent()
+    test_two_qubit_gate_out_buffer()